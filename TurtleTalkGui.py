@@ -32,18 +32,44 @@ Please see the LICENSE.md for more details
 
 from typing import Iterator, Tuple
 from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import QProcess, QSettings, QTimer, Qt, QIODevice, pyqtSlot
+from PyQt5.QtCore import (QSettings, QTimer, Qt, QIODevice, pyqtSlot,
+                          QObject, QRunnable, QThreadPool, pyqtSignal)
 from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
 from datetime import datetime
 import sys
+import time
 import os.path
 import logging
-import math
+import logging.handlers
+import atexit
 import re
-import binascii
+import bisect
+import functools
+import operator
 import zlib
 import random
+import importlib
+
+# Optional compiled checksum loop, opt in with TURTLETALK_NUMBA=1. Importing
+# numba slows startup, and the pure Python fold is plenty for NMEA sentences
+if os.environ.get('TURTLETALK_NUMBA') != '1':
+    _xor_reduce = None
+else:
+    try:
+        import numpy as np
+        from numba import njit, types
+
+        # Explicit signature compiles here at import, not on the first send
+        @njit(types.int64(types.Array(types.uint8, 1, 'C', readonly=True)),
+              cache=True)
+        def _xor_reduce(buf):
+            c = 0
+            for i in range(buf.size):
+                c ^= buf[i]
+            return c
+    except ImportError:
+        _xor_reduce = None
 
 # Constants
 GUIVERSION = 'v1.0.0'
@@ -52,6 +78,15 @@ ORGNAME = "TurtleTalk"
 LOGFILENAME = 'TurtleTalk.log'
 GRIBFOLDER = 'GRIBs'
 MSGLOG = 'MessageHistory.log'
+PACKET_CACHE_SIZE = 64
+SERIAL_MONITOR_MAX_LINES = 5000
+MESSAGES_MAX_LINES = 10000
+RECALC_DELAY_MS = 50
+MAILBOX_POLL_MS = 15000
+SETTINGS_SYNC_DELAY_MS = 500
+TX_CHUNK_SIZE = 4096
+SERIAL_REPLY_TIMEOUT_MS = 2000
+SWAR_CHECKSUM_MIN = 64  # Bytes before chksum_nmea XORs whole words
 
 # SWARM Constants
 APPID_OUTGOING_GPS_PING = 37400
@@ -62,78 +97,225 @@ APPID_OUTGOING_GRIBRQ_PART_REQ = 37610
 APPID_INCOMING_MESSAGE = 37550
 APPID_INCOMING_MESSAGE_PART_REQ = 37560
 APPID_INCOMING_GRIB = 37700
+SWARM_MAX_PAYLOAD = 192  # Bytes of data in a single TD packet
+MESSAGE_CHUNK_SIZE = SWARM_MAX_PAYLOAD - 4  # After the ID/part/total header
+MESSAGE_MAX_PACKETS = 255  # Part and total are one header byte each
 
 # Settings
 SETTING_PORT_NAME = 'COM1'
 
-# Setup global log
-logging.basicConfig(filename=LOGFILENAME,
-                    filemode='w',
-                    format='%(asctime)s %(name)s \t %(levelname)s \t %(message)s',
-                    datefmt='%H:%M:%S',
-                    level=logging.DEBUG)
+# NMEA field delimiters
+_NMEA_SPLIT = re.compile(r'[\s,*=]')
+_NMEA_TRANS = str.maketrans({',': ' ', '*': ' ', '=': ' '})
+
+# Sentences that only update current state, older ones in a burst are stale
+_STATUS_SENTENCES = frozenset({'$RT', '$MT', '$GN'})
+# Command acks share those prefixes but carry no reading, e.g. $RT OK*22
+_STATUS_ACK = ' OK*'
+
+# GRIB forecast range choices in days for each model, built once at import
+_GFS_RANGE = tuple(sys.intern(str(i)) for i in range(1, 17))
+_RTOFS_RANGE = tuple(sys.intern(str(i)) for i in range(1, 7))
+
+# Plain int check states, setCheckState takes these without enum wrapping
+_CHECKED = int(Qt.Checked)
+_UNCHECKED = int(Qt.Unchecked)
+
+# GRIB model presets, checkbox name -> (enabled, check state)
+# Checkboxes not listed get _PROFILE_DEFAULT, enabled and unchecked
+_PROFILE_DEFAULT = (True, _UNCHECKED)
+MODEL_PROFILES = {
+    'GFS': {
+        'Current': (False, _UNCHECKED),
+        'Wind': (True, _CHECKED),
+        'Pressure': (True, _CHECKED),
+    },
+    'RTOFS': {
+        'Current': (False, _CHECKED),
+        'AirT': (False, _UNCHECKED),
+        'CAPE': (False, _UNCHECKED),
+        'Cloud': (False, _UNCHECKED),
+        'Pressure': (False, _UNCHECKED),
+        'Wave': (False, _UNCHECKED),
+        'Wind': (False, _UNCHECKED),
+        'Wing': (False, _UNCHECKED),
+    },
+}
+MODEL_RANGES = {
+    'GFS': _GFS_RANGE,
+    'RTOFS': _RTOFS_RANGE,
+}
+
+# GRIB models without presets, selecting one leaves the form untouched
+_NOOP_MODELS = frozenset({'Local', 'ECMWF (Coming Soon)', 'SPIRE (Coming Soon)'})
+
+# $MM replies that carry no messages
+_MM_IGNORE = ("DBX_NOMORE", "CMD_BADPARAMVALUE", "MM OK*24", "MM 0*10")
+
+# Noise RSSI quality, each bound is the upper (inclusive) limit of its label
+_RSSI_BOUNDS = (-105, -100, -97, -93)
+_RSSI_LABELS = (" Great", " Good", " OK", " Marginal", " Bad")
+
+# Setup global log, buffered in memory and written out in batches
+log_file_handler = logging.FileHandler(LOGFILENAME, mode='w')
+log_file_handler.setFormatter(logging.Formatter(
+    '%(asctime)s %(name)s \t %(levelname)s \t %(message)s', datefmt='%H:%M:%S'))
+log_handler = logging.handlers.MemoryHandler(
+    1024, flushLevel=logging.ERROR, target=log_file_handler)
+logging.getLogger().addHandler(log_handler)
+logging.getLogger().setLevel(logging.DEBUG)
+atexit.register(log_handler.flush)
 
 logging.info("SwarmSailor Log Started")
 
 
+_ts_last = [0, '']
+
+
+def _now_hms() -> str:
+    """Return the local time as HH:MM:SS, formatted at most once per second."""
+    t = int(time.time())
+    if t != _ts_last[0]:
+        _ts_last[0] = t
+        _ts_last[1] = time.strftime("%H:%M:%S", time.localtime(t))
+    return _ts_last[1]
+
+
+# .ui file -> (pyuic5 module, form class) compiled from it
+_UI_FORMS = {
+    'dialog.ui': ('ui_dialog', 'Ui_MainWindow'),
+    'message.ui': ('ui_message', 'Ui_QDialog_message'),
+    'gribReq.ui': ('ui_gribReq', 'Ui_QDialog_GRIB'),
+}
+
+
+def load_form(widget, ui_file):
+    """Build ui_file onto widget from its pyuic5 module, else parse the XML."""
+    module_name, class_name = _UI_FORMS[ui_file]
+    try:
+        form = getattr(importlib.import_module(module_name), class_name)()
+    except (ImportError, AttributeError):
+        uic.loadUi(ui_file, widget)
+        return None
+    form.setupUi(widget)
+    return form
+
+
+def nmea_checksum(sentence) -> int:
+    """Return the NMEA checksum of a str or bytes sentence."""
+    # XOR every byte of the sentence together, the final value is our checksum
+    data = sentence.encode('utf-8') if isinstance(sentence, str) else sentence
+    if _xor_reduce is not None:
+        return int(_xor_reduce(np.frombuffer(data, dtype=np.uint8)))
+    if len(data) < SWAR_CHECKSUM_MIN:
+        return functools.reduce(operator.xor, data, 0)
+    # Long packets, XOR 8 bytes at a time then fold the word to a byte
+    data += b'\0' * (-len(data) % 8)
+    acc = 0
+    for i in range(0, len(data), 8):
+        acc ^= int.from_bytes(data[i:i + 8], 'little')
+    acc ^= acc >> 32
+    acc ^= acc >> 16
+    acc ^= acc >> 8
+    return acc & 0xFF
+
+
+def frame_nmea(payload: bytes) -> bytes:
+    """Return payload framed as a $payload*XX sentence with its newline."""
+    return b'$%b*%02X\n' % (payload, nmea_checksum(payload))
+
+
+def show_error(parent, text):
+    """Show a modal error box over parent."""
+    msg = QtWidgets.QMessageBox(parent)
+    msg.setWindowTitle("Error")
+    msg.setText(text)
+    msg.setIcon(QtWidgets.QMessageBox.Critical)
+    msg.exec_()
+
+
+@functools.lru_cache(maxsize=PACKET_CACHE_SIZE)
+def frame_command(message: str) -> Tuple[str, bytes]:
+    """Return the echo text and packet for message, recently used ones are
+    kept so the fixed poll commands skip framing."""
+    packet = frame_nmea(message.encode('utf-8'))
+    return packet[:-1].decode('utf-8'), packet
+
+
 def gen_serial_ports() -> Iterator[Tuple[str, str, str]]:
     """Return all available serial ports."""
     ports = QSerialPortInfo.availablePorts()
     return ((p.description(), p.portName(), p.systemLocation()) for p in ports)
 
 
+class PortScanSignals(QObject):
+    finished = pyqtSignal(list)
+
+
+class PortScanTask(QRunnable):
+    """Enumerate serial ports on a pool thread, the device scan can stall."""
+
+    def __init__(self):
+        super(PortScanTask, self).__init__()
+        self.signals = PortScanSignals()
+
+    def run(self):
+        self.signals.finished.emit(list(gen_serial_ports()))
+
+
 class system_status:
-    comm_status = "Disconnected"
-    RSSI = 0
-    tx_waiting = 0
-    rx_waiting = 0
+    __slots__ = ('comm_status', 'RSSI', 'tx_waiting', 'rx_waiting',
+                 '_nice_key', '_nice_text')
 
-    def print_nice(self):
-        return_string = self.comm_status + "\n"
-        return_string += "Noise RSSI: " + str(self.RSSI)
-        if (self.RSSI <= -105):
-            return_string += " Great"
-        elif (self.RSSI <= -100):
-            return_string += " Good"
-        elif (self.RSSI <= -97):
-            return_string += " OK"
-        elif (self.RSSI <= -93):
-            return_string += " Marginal"
-        else:
-            return_string += " Bad"
-        
+    def __init__(self):
+        self.comm_status = "Disconnected"
+        self.RSSI = 0
+        self.tx_waiting = 0
+        self.rx_waiting = 0
+        self._nice_key = None
+        self._nice_text = ""
 
-        if (self.tx_waiting != 0):
-            return_string += "\n" + "TX Waiting: " + str(self.tx_waiting)
-        if (self.rx_waiting != 0):
-            return_string += "\n" + "RX Waiting: " + str(self.rx_waiting)
-        return return_string
+    def print_nice(self):
+        # Rebuilt only when a field has changed since the last call
+        key = (self.comm_status, self.RSSI, self.tx_waiting, self.rx_waiting)
+        if key != self._nice_key:
+            quality = _RSSI_LABELS[bisect.bisect_left(_RSSI_BOUNDS, self.RSSI)]
+            tx = f"\nTX Waiting: {self.tx_waiting}" if self.tx_waiting != 0 else ""
+            rx = f"\nRX Waiting: {self.rx_waiting}" if self.rx_waiting != 0 else ""
+            self._nice_text = f"{self.comm_status}\nNoise RSSI: {self.RSSI}{quality}{tx}{rx}"
+            self._nice_key = key
+        return self._nice_text
 
 
 class Geolocation:
-    latitude = 0.0
-    longitude = 0.0
-    altitude = 0
-    course = 0
-    speed = 0
+    __slots__ = ('latitude', 'longitude', 'altitude', 'course', 'speed',
+                 '_nice_key', '_nice_text')
+
+    def __init__(self):
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.altitude = 0
+        self.course = 0
+        self.speed = 0
+        self._nice_key = None
+        self._nice_text = ""
 
     def return_location(self):
-        return str(self.latitude) + ", " + str(self.longitude)
+        return f"{self.latitude}, {self.longitude}"
 
     def print_nice(self):
-        return str(self.latitude) + ", " + str(self.longitude) + "\n" + str(self.altitude) + "m\n" + str(self.speed) + "kph, " + str(self.course).zfill(3) + "°"
+        key = (self.latitude, self.longitude, self.altitude, self.speed, self.course)
+        if key != self._nice_key:
+            self._nice_text = f"{self.latitude}, {self.longitude}\n{self.altitude}m\n{self.speed}kph, {self.course:03}°"
+            self._nice_key = key
+        return self._nice_text
 
 
 class SwarmMessage:
-    appid = ''
-    rssi = ''
-    snr = ''
-    fdev = ''
-    data = ''
+    __slots__ = ('appid', 'rssi', 'snr', 'fdev', 'data')
 
     def __init__(self, buildabear):
-        regex = '\s|,|\*|='
-        array = re.split(regex, buildabear)
+        array = buildabear.translate(_NMEA_TRANS).split(None, 5)
         self.appid = array[0]
         self.rssi = array[1]
         self.snr = array[2]
@@ -141,19 +323,17 @@ class SwarmMessage:
         self.data = array[4]
 
     def print_nice(self):
-        return "New Message " + self.data
+        return f"New Message {self.data}"
 
-    def write_to_disk(self):
+    def write_to_disk(self, msglog):
         current_time = datetime.now().strftime("%c")
         if (self.appid == APPID_INCOMING_GRIB):
             print_file = open(GRIBFOLDER + "/" + current_time +
                               self.data[0:6] + ".grb2", 'w')
             print(self.print_nice(), file=print_file)
             print_file.close()
-        else:  # Write to message log
-            print_file = open(MSGLOG, 'a')
-            print(current_time + " < " + self.print_nice(), file=print_file)
-            print_file.close()
+        else:  # Write to the open message log
+            msglog.write(current_time + " < " + self.print_nice() + "\n")
 
 
 # Global variable
@@ -164,7 +344,45 @@ current_system_status = system_status()
 class Ui(QtWidgets.QMainWindow):
     def __init__(self):
         super(Ui, self).__init__()
-        uic.loadUi('dialog.ui', self)
+        self._form = load_form(self, 'dialog.ui')
+
+        # Widgets
+        self._serial_display = self.findChild(
+            QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display')
+        self._messages_display = self.findChild(
+            QtWidgets.QPlainTextEdit, 'Messages_Display')
+        self._port_combo = self.findChild(QtWidgets.QComboBox, 'comboBox_PORT')
+        self._tracker_button = self.findChild(
+            QtWidgets.QPushButton, 'Button_GPS_Tracker')
+        self._gnss_label = self.findChild(QtWidgets.QLabel, 'data_GNSS')
+        self._status_label = self.findChild(QtWidgets.QLabel, 'data_Status')
+        self._send_line = self.findChild(
+            QtWidgets.QLineEdit, 'Serial_Monitor_SendLine')
+        self._advanced_section = self.findChild(
+            QtWidgets.QWidget, 'advancedSection')
+
+        # Last text shown by timer1s_exec
+        self._last_gnss_text = None
+        self._last_status_text = None
+        self._last_tracker_text = None
+
+        # Open child dialogs, owned by this window and dropped at shutdown
+        self._dialogs = []
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._dialogs.clear)
+
+        self._rx_buf = bytearray()  # Received bytes not yet split into lines
+        self._rx_waiting_reply = False
+        self._tx_buf = bytearray()  # Framed commands waiting for the port
+        # Open state of self.ser, kept current by its signals
+        self._ser_open = False
+
+        # Incoming sentence handlers, keyed on the sentence prefix
+        self._dispatch = {
+            '$RT': self.handle_rt,
+            '$MT': self.handle_mt,
+            '$MM': self.handle_mm,
+            '$GN': self.handle_gn,
+        }
 
         # Timers
         self.timer1s = QTimer()
@@ -175,6 +393,17 @@ class Ui(QtWidgets.QMainWindow):
         self.timer5s.timeout.connect(self.timer5s_exec)
         self.timer5s.start(5000)
 
+        self.timerMail = QTimer()
+        self.timerMail.timeout.connect(self.timer_mail_exec)
+        self.timerMail.start(MAILBOX_POLL_MS)
+
+        # Settings handle, rapid saves share one deferred sync to disk
+        self.settings = QSettings(APPNAME, ORGNAME)
+        self._settings_sync_timer = QTimer(self)
+        self._settings_sync_timer.setSingleShot(True)
+        self._settings_sync_timer.setInterval(SETTINGS_SYNC_DELAY_MS)
+        self._settings_sync_timer.timeout.connect(self.settings.sync)
+
         self.timerTracker = QTimer()
         self.timerTracker.timeout.connect(self.timer_tracker_exec)
 
@@ -182,73 +411,81 @@ class Ui(QtWidgets.QMainWindow):
         self.setWindowTitle(
             'Swarm M138 GUI - by SwarmSailor - ' + GUIVERSION)  # Update Title
         # self.findChild(QtWidgets.QWidget, 'advancedSection').hide() #Hide Advanced Section
+        self._port_scan_task = None  # Background scan in flight
+        self._port_scan_repopulate = False
         self.update_com_ports()  # get COMS
 
         # Text boxes
-        self.findChild(QtWidgets.QPlainTextEdit, 'Messages_Display').setReadOnly(
+        self._messages_display.setReadOnly(
             True)  # Make these text edit windows read-only
-        self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').setReadOnly(
+        self._serial_display.setReadOnly(
             True)  # Make these text edit windows read-only
-
-        # Buttons
-        self.findChild(QtWidgets.QPushButton, 'Button_Advanced').clicked.connect(
+        # Cap the line count so appends stay cheap in long sessions
+        self._serial_display.setMaximumBlockCount(SERIAL_MONITOR_MAX_LINES)
+        self._messages_display.setMaximumBlockCount(MESSAGES_MAX_LINES)
+
+        # Buttons, gathered in one walk of the widget tree
+        buttons = {button.objectName(): button
+                   for button in self.findChildren(QtWidgets.QPushButton)}
+        buttons['Button_Advanced'].clicked.connect(
             self.Button_Advanced_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Close_Port').clicked.connect(
+        buttons['Button_Close_Port'].clicked.connect(
             self.Button_Close_Port_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Get_GRIB').clicked.connect(
+        buttons['Button_Get_GRIB'].clicked.connect(
             self.Button_Get_GRIB_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Open_Port').clicked.connect(
+        buttons['Button_Open_Port'].clicked.connect(
             self.Button_Open_Port_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Refresh_PORT').clicked.connect(
+        buttons['Button_Refresh_PORT'].clicked.connect(
             self.Button_Refresh_PORT_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Send_Message').clicked.connect(
+        buttons['Button_Send_Message'].clicked.connect(
             self.Button_Send_Message_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_GPS_Tracker').clicked.connect(
+        self._tracker_button.clicked.connect(
             self.Button_GPS_Tracker_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Send_Ping').clicked.connect(
+        buttons['Button_Send_Ping'].clicked.connect(
             self.Button_Send_Ping_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Firmware').clicked.connect(
+        buttons['Button_Firmware'].clicked.connect(
             self.Button_Firmware_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Geospatial').clicked.connect(
+        buttons['Button_Geospatial'].clicked.connect(
             self.Button_Geospatial_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Empty_TX').clicked.connect(
+        buttons['Button_Empty_TX'].clicked.connect(
             self.Button_Empty_TX_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Restart').clicked.connect(
+        buttons['Button_Restart'].clicked.connect(
             self.Button_Restart_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Serial_Monitor_Send').clicked.connect(
+        buttons['Button_Serial_Monitor_Send'].clicked.connect(
             self.Button_Serial_Monitor_Send_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Serial_Terminal_Clear').clicked.connect(
+        buttons['Button_Serial_Terminal_Clear'].clicked.connect(
             self.Button_Serial_Terminal_Clear_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_DeviceID').clicked.connect(
+        buttons['Button_DeviceID'].clicked.connect(
             self.Button_DeviceID_click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Mailbox').clicked.connect(
+        buttons['Button_Mailbox'].clicked.connect(
             self.Mailbox_check)
 
-        self.loadHistory()
+        # Message log stays open for appends, line buffered so each entry
+        # reaches the file as soon as it is written
+        self._msglog_fp = open(MSGLOG, 'a', buffering=1)
 
         self.show()
 
+        # Load history once the event loop is running so the window paints first
+        QTimer.singleShot(0, self._post_show_init)
+
+    def _post_show_init(self):
+        self.loadHistory()
+
     def Button_Advanced_click(self):
-        self.widget = self.findChild(QtWidgets.QWidget, 'advancedSection')
-        if self.widget.isVisible():
-            self.widget.hide()
+        if self._advanced_section.isVisible():
+            self._advanced_section.hide()
         else:
-            self.widget.show()
+            self._advanced_section.show()
 
     def printer(self, somedata):
         print(somedata)
 
     def Button_Open_Port_click(self):
-        port_available = False
-        for desc, name, sys in gen_serial_ports():
-            try:
-                if (sys == self.currentPort()):
-                    port_available = True
-            except:
-                pass
+        port_available = self.currentPort() in self._available_ports
 
         if (port_available == False):
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Error: Port Not Available!")
             current_system_status.comm_status = "Error: Port Not Available!"
             try:
@@ -257,27 +494,21 @@ class Ui(QtWidgets.QMainWindow):
                 pass
             return
 
-        try:
-            if self.ser.isOpen():
-                port_available = True
-            else:
-                port_available = False
-        except:
-            port_available = False
-
-        if (port_available == True):
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+        if self._ser_open:
+            self._serial_display.appendPlainText(
                 "Port Is Already Open!")
             return
 
         try:
             self.ser = QSerialPort()
+            self._rx_buf.clear()
+            self._tx_buf.clear()
             self.ser.setPortName(self.currentPort())
             self.ser.setBaudRate(QSerialPort.Baud115200)
             if (self.ser.open(QIODevice.ReadWrite) == False):
                 raise Exception("Failed to open Serial Port")
         except Exception as err:
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Error: Failed to Open Port {}".format(err))
             current_system_status.comm_status = "Error: Failed to Open Port"
             try:
@@ -286,6 +517,11 @@ class Ui(QtWidgets.QMainWindow):
                 pass
             return
 
+        self._ser_open = True
+        self.ser.aboutToClose.connect(self.serial_closed)
+        self.ser.errorOccurred.connect(self.serial_error)
+        self.ser.bytesWritten.connect(self.pump_tx)
+
         self.save_settings()
 
         self.ser.readyRead.connect(self.receive)  # Connect the receiver
@@ -297,22 +533,15 @@ class Ui(QtWidgets.QMainWindow):
 
         self.Mailbox_check()
 
-        self.findChild(QtWidgets.QPlainTextEdit,
-                       'Serial_Monitor_Display').appendPlainText("Port is now open")
+        self._serial_display.appendPlainText("Port is now open")
         current_system_status.comm_status = "Comm OK"
 
     def Button_Close_Port_click(self):
         """Close the port"""
-        port_available = False
-        for desc, name, sys in gen_serial_ports():
-            try:
-                if (sys == self.currentPort()):
-                    port_available = True
-            except:
-                pass
+        port_available = self.currentPort() in self._available_ports
 
         if (port_available == False):
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Error: Port No Longer Available!")
             current_system_status.comm_status = "Error: Port Not Available!"
             try:
@@ -321,16 +550,8 @@ class Ui(QtWidgets.QMainWindow):
                 pass
             return
 
-        try:
-            if self.ser.isOpen():
-                port_available = True
-            else:
-                port_available = False
-        except:
-            port_available = False
-
-        if (port_available == False):
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+        if not self._ser_open:
+            self._serial_display.appendPlainText(
                 "Port Is Already Closed!")
             try:
                 self.ser.close()
@@ -341,54 +562,88 @@ class Ui(QtWidgets.QMainWindow):
         try:
             self.ser.close()
         except:
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Error: Could Not Close The Port!")
             return
 
         self.save_settings()
-        self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+        self._serial_display.appendPlainText(
             "Port is now closed")
 
+    def serial_closed(self):
+        self._ser_open = False
+        self._tx_buf.clear()
+
+    def pump_tx(self, *args):
+        """Hand queued frames to the port once its last write has drained"""
+        if not self._tx_buf or self.ser.bytesToWrite() > 0:
+            return
+        written = self.ser.write(bytes(self._tx_buf[:TX_CHUNK_SIZE]))
+        if written > 0:
+            del self._tx_buf[:written]
+
+    def flush_tx(self):
+        """Hand everything queued to the port now, for callers that block on it"""
+        if self._tx_buf:
+            written = self.ser.write(bytes(self._tx_buf))
+            if written > 0:
+                del self._tx_buf[:written]
+
+    def serial_error(self, error):
+        # The device went away, close so the open state follows
+        if error == QSerialPort.ResourceError:
+            self.ser.close()
+
     def Button_Refresh_PORT_click(self):
         try:
             self.ser.close()
         except:
             pass
         current_system_status.comm_status = "Disconnected"
-        self.update_com_ports()
+        self.scan_ports(repopulate=True)
 
     def Button_Get_GRIB_click(self):
-        dialog = QDialogGRIB()
-        if(dialog.exec_() != 1):
-            return
-        self.sendTDSwarmStr(APPID_OUTGOING_GRIBRQ, dialog.returnString())
+        dialog = QDialogGRIB(self)
+        self._dialogs.append(dialog)
+        try:
+            if(dialog.exec_() != 1):
+                return
+            self.sendTDSwarmStr(APPID_OUTGOING_GRIBRQ, dialog.returnString())
+        finally:
+            self._dialogs.remove(dialog)
+            dialog.deleteLater()
 
     def Button_Send_Message_click(self):
-        dialog = QDialogMessage()
-        if(dialog.exec_() != 1):
-            return
-        message_data = dialog.returnData()
+        dialog = QDialogMessage(self)
+        self._dialogs.append(dialog)
+        try:
+            if(dialog.exec_() != 1):
+                return
+            message_data = dialog.returnData()
+        finally:
+            self._dialogs.remove(dialog)
+            dialog.deleteLater()
         messageID = random.randint(1, 65535)
-        packet_total = math.ceil(float(len(message_data))/188.0)
+        packet_total = -(-len(message_data) // MESSAGE_CHUNK_SIZE)
         for x in range(packet_total):
             message_outgoing = bytearray()
             message_outgoing += messageID.to_bytes(2, 'big')
             message_outgoing.append(x+1)
             message_outgoing.append(packet_total)
-            message_outgoing += message_data[:188]
-            message_data = message_data[188:]
+            message_outgoing += message_data[:MESSAGE_CHUNK_SIZE]
+            message_data = message_data[MESSAGE_CHUNK_SIZE:]
             self.sendTDSwarmHex(APPID_OUTGOING_MESSAGE, message_outgoing)
 
     def Button_GPS_Tracker_click(self):
         if (self.tracker_active):
             self.tracker_active = False
             self.timerTracker.stop()  # Stop broadcasting
-            self.findChild(QtWidgets.QPushButton, 'Button_GPS_Tracker').setStyleSheet(
+            self._tracker_button.setStyleSheet(
                 'QPushButton {}')
         else:
             self.tracker_active = True
             self.timerTracker.start(1000 * 60 * 60)  # Send every hour
-            self.findChild(QtWidgets.QPushButton, 'Button_GPS_Tracker').setStyleSheet(
+            self._tracker_button.setStyleSheet(
                 'QPushButton {background-color: #52BE80;}')
     tracker_active = False
 
@@ -396,9 +651,8 @@ class Ui(QtWidgets.QMainWindow):
         self.timer_tracker_exec()
 
     def Button_Serial_Monitor_Send_click(self):
-        self.send_Serial_Command(self.findChild(
-            QtWidgets.QLineEdit, 'Serial_Monitor_SendLine').text())
-        self.findChild(QtWidgets.QLineEdit, 'Serial_Monitor_SendLine').clear()
+        self.send_Serial_Command(self._send_line.text())
+        self._send_line.clear()
 
     def Button_DeviceID_click(self):
         self.send_Serial_Command('CS')
@@ -422,21 +676,17 @@ class Ui(QtWidgets.QMainWindow):
         self.send_Serial_Command('RS')
 
     def Button_Serial_Terminal_Clear_click(self):
-        self.findChild(QtWidgets.QPlainTextEdit,
-                       'Serial_Monitor_Display').clear()
+        self._serial_display.clear()
 
     def Mailbox_check(self):
+        # A manual check covers this interval, so count the next poll from now
+        self.timerMail.start()
         self.send_Serial_Command("MM L=U")  # request count of unread
         self.send_Serial_Command("MT C=U")  # request count of unsent
 
     def send_Serial_Command(self, message, printthis=True) -> None:
-        port_available = False
-        for desc, name, sys in gen_serial_ports():
-            try:
-                if (sys == self.currentPort() and self.ser.isOpen()):
-                    port_available = True
-            except:
-                pass
+        port_available = (self._ser_open
+                          and self.currentPort() in self._available_ports)
 
         if (port_available == False):
             current_system_status.comm_status = "Error: Port Not Available!"
@@ -447,26 +697,18 @@ class Ui(QtWidgets.QMainWindow):
             return
 
         if (message == ''):
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Warning: Nothing To Do! Message Is Empty!")
             return
 
-        self.ser.write(bytes('$', 'utf-8'))  # Send the $
-        self.ser.write(bytes(message, 'utf-8'))  # Send the message
-        self.ser.write(bytes('*', 'utf-8'))  # Send the *
-        self.ser.write(str.format(
-            '{:02X}', self.chksum_nmea(message)).encode('utf-8'))
-        self.ser.write(bytes('\n', 'utf-8'))
+        sentence, packet = frame_command(message)
+        # Queue the whole $message*XX sentence, written now if the port is idle
+        self._tx_buf += packet
+        self.pump_tx()
 
         if (printthis):
-            print_msg = datetime.now().strftime("%H:%M:%S")
-            print_msg += " > $"
-            print_msg += message
-            print_msg += "*"
-            print_msg += str.format('{:02X}', self.chksum_nmea(message)
-                                    ).encode('utf-8').decode('utf-8')
-            self.findChild(QtWidgets.QPlainTextEdit,
-                           'Serial_Monitor_Display').appendPlainText(print_msg)
+            ts = _now_hms()
+            self._serial_display.appendPlainText(f'{ts} > {sentence}')
 
     def sendTDSwarmStr(self, appid, message):
         packet = "TD AI=" + str(appid) + ",\"" + message + "\""
@@ -478,87 +720,184 @@ class Ui(QtWidgets.QMainWindow):
 
     @pyqtSlot()
     def receive(self) -> None:
+        if self._rx_waiting_reply:  # read_reply_line owns the port for now
+            return
         try:
-            while self.ser.canReadLine():
-                text = self.ser.readLine().data().decode()
-                current_time = datetime.now().strftime("%H:%M:%S")
-                regex = '\s|,|\*|='
-                if (text[0:3] == "$RT"):
-                        array = re.split(regex, text)
-                        current_system_status.RSSI = int(array[2])
-                        if (len(array) != 5):
-                            print(text.strip())
-                elif (text[0:3] == "$MT"):
-                        array = re.split(regex, text)
-                        current_system_status.tx_waiting = array[1]
-                elif (text[0:3] == "$MM"):
-                        substring_ignore_list = [
-                            "DBX_NOMORE", "CMD_BADPARAMVALUE", "MM OK*24", "MM 0*10"]
-                        if any(substring in text for substring in substring_ignore_list):
-                            break
-                        else:
-                            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
-                                current_time + " < " + text.strip())
-                            array = re.split(regex, text)
-                            self.getUnreadMessages(array[1:])
-                elif (text[0:3] == "$GN"):
-                        array = re.split(regex, text)
-                        current_geolocation.latitude = float(array[1])
-                        current_geolocation.longitude = float(array[2])
-                        current_geolocation.altitude = int(array[3])
-                        current_geolocation.course = int(array[4])
-                        current_geolocation.speed = int(array[5])
-                else:
-                        self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
-                            current_time + " < " + text.strip())
-        except:
-            pass
+            # Drain everything that is waiting before touching the GUI,
+            # any trailing partial line stays buffered for the next call
+            buf = self._rx_buf
+            buf += self.ser.readAll().data()
+            end = buf.rfind(b'\n') + 1
+            if not end:  # Only part of a line has arrived so far
+                return
+            lines = buf[:end].decode('utf-8', 'replace').split('\n')
+            lines.pop()  # Empty text after the final newline
+            del buf[:end]
+            current_time = _now_hms()
+
+            latest = {}  # only the newest status sentence of each kind matters
+            display = []
+            # One layout pass for the whole burst
+            self._serial_display.setUpdatesEnabled(False)
+            try:
+                for text in lines:
+                    prefix = text[:3]
+                    if prefix in _STATUS_SENTENCES:
+                        if _STATUS_ACK not in text:  # Keep the last real reading
+                            latest[prefix] = text
+                        continue
+                    handler = self._dispatch.get(prefix)
+                    if handler is None:
+                        display.append(current_time + " < " + text.strip())
+                        continue
+                    if display:
+                        self._serial_display.appendPlainText('\n'.join(display))
+                        display = []
+                    self.run_handler(handler, text, current_time)
+                if display:
+                    self._serial_display.appendPlainText('\n'.join(display))
+            finally:
+                self._serial_display.setUpdatesEnabled(True)
+            for prefix, text in latest.items():
+                self.run_handler(self._dispatch[prefix], text, current_time)
+        except Exception:
+            logging.exception("Serial receive failed")
+
+    def run_handler(self, handler, text, current_time):
+        # A malformed sentence is logged and skipped, the rest still run
+        try:
+            handler(text, current_time)
+        except Exception:
+            logging.warning("Unable to parse " + text.strip(), exc_info=True)
+
+    def handle_rt(self, text, current_time):
+        # $RT RSSI=-101*1c, the value ends at the checksum or the next field
+        field = text.split('=', 2)[1].split('*', 1)[0]
+        value, sep, rest = field.partition(',')
+        current_system_status.RSSI = int(value)
+        if sep:  # Extended reading with SNR and friends
+            logging.debug("RSSI: " + text.strip())
+
+    def handle_mt(self, text, current_time):
+        array = _NMEA_SPLIT.split(text, 2)
+        current_system_status.tx_waiting = array[1]
+
+    def handle_mm(self, text, current_time):
+        if any(substring in text for substring in _MM_IGNORE):
+            return
+        self._serial_display.appendPlainText(
+            current_time + " < " + text.strip())
+        array = _NMEA_SPLIT.split(text)
+        self.getUnreadMessages(array[1:])
+
+    def handle_gn(self, text, current_time):
+        array = _NMEA_SPLIT.split(text, 6)
+        geolocation = current_geolocation  # One global lookup for five slot writes
+        geolocation.latitude = float(array[1])
+        geolocation.longitude = float(array[2])
+        geolocation.altitude = int(array[3])
+        geolocation.course = int(array[4])
+        geolocation.speed = int(array[5])
 
     def getUnreadMessages(self, list_messages):
         logging.info("Incoming Data: " + list_messages)
-        regex = '\s|,|\*|='
-        array = re.split(regex, list_messages)
+        array = _NMEA_SPLIT.split(list_messages)
         for x in array:
-            self.findChild(QtWidgets.QPlainTextEdit, 'Serial_Monitor_Display').appendPlainText(
+            self._serial_display.appendPlainText(
                 "Array Item: " + x)
             self.send_Serial_Command("MM R=" + x)
+            self.flush_tx()  # Queued behind a busy port, the wait would miss it
             self.ser.waitForBytesWritten()
-            new_message = self.ser.readLine().data().decode()
+            new_message = self.read_reply_line(b'$MM')
+            if new_message is None:
+                logging.warning("No reply reading message " + x)
+                continue
             incoming_message = SwarmMessage(new_message)
-            current_time = datetime.now().strftime("%H:%M:%S")
+            current_time = _now_hms()
             if (incoming_message.appID == str(APPID_INCOMING_MESSAGE)):
-                self.findChild(QtWidgets.QPlainTextEdit, 'Messages_Display').appendPlainText(
+                self._messages_display.appendPlainText(
                     current_time + " < " + incoming_message.print_nice())
             elif (incoming_message.appID == str(APPID_INCOMING_GRIB)):
-                self.findChild(QtWidgets.QPlainTextEdit, 'Messages_Display').appendPlainText(
+                self._messages_display.appendPlainText(
                     current_time + " < " + "GRIB Recieved")
             else:
-                self.findChild(QtWidgets.QPlainTextEdit, 'Messages_Display').appendPlainText(
+                self._messages_display.appendPlainText(
                     current_time + " < " + "Uknown Message Receieved")
-            incoming_message.write_to_disk()
+            incoming_message.write_to_disk(self._msglog_fp)
+
+    def read_reply_line(self, prefix):
+        """Wait for the next line starting with prefix and take it out of
+        _rx_buf, other lines stay buffered for receive()"""
+        buf = self._rx_buf
+        deadline = time.monotonic() + SERIAL_REPLY_TIMEOUT_MS / 1000
+        self._rx_waiting_reply = True
+        try:
+            while True:
+                buf += self.ser.readAll().data()
+                start = 0
+                end = buf.find(b'\n')
+                while end >= 0:
+                    if buf.startswith(prefix, start):
+                        line = bytes(buf[start:end])
+                        del buf[start:end + 1]
+                        return line.decode('utf-8', 'replace')
+                    start = end + 1
+                    end = buf.find(b'\n', start)
+                remaining = int((deadline - time.monotonic()) * 1000)
+                if remaining <= 0 or not self.ser.waitForReadyRead(remaining):
+                    return None
+        finally:
+            self._rx_waiting_reply = False
+            if b'\n' in buf:  # Lines that arrived meanwhile
+                QTimer.singleShot(0, self.receive)
 
     def currentLocation(self):
         return (self.current_geolocation)
 
     def chksum_nmea(self, sentence):
         """Calculate the NMEA checksum"""
-        # Initializing our first XOR value
-        csum = 0
-        # For each char in chksumdata, XOR against the previous XOR'd char.
-        # The final XOR of the last char will be our  checksum
-        for c in sentence:
-            csum ^= ord(c)
-        return csum
+        return nmea_checksum(sentence)
 
     def timer1s_exec(self) -> None:
+        # Do GUI Updates, only touching widgets whose text has changed
+        gnss_text = current_geolocation.print_nice()
+        if gnss_text != self._last_gnss_text:
+            self._gnss_label.setText(gnss_text)
+            self._last_gnss_text = gnss_text
+        status_text = current_system_status.print_nice()
+        if status_text != self._last_status_text:
+            self._status_label.setText(status_text)
+            self._last_status_text = status_text
+        if (self.tracker_active):
+            tracker_text = 'GPS Tracker ' + \
+                str(round(self.timerTracker.remainingTime() / 1000 / 60, 1)) + " min"
+        else:
+            tracker_text = 'GPS Tracker'
+        if tracker_text != self._last_tracker_text:
+            self._tracker_button.setText(tracker_text)
+            self._last_tracker_text = tracker_text
+
+    def timer5s_exec(self):
+        self.scan_ports()
+
+    def scan_ports(self, repopulate=False):
+        """Start a background port scan unless one is already running"""
+        self._port_scan_repopulate |= repopulate
+        if self._port_scan_task is not None:
+            return
+        self._port_scan_task = PortScanTask()
+        self._port_scan_task.signals.finished.connect(self.ports_scanned)
+        QThreadPool.globalInstance().start(self._port_scan_task)
+
+    def ports_scanned(self, ports):
+        self._port_scan_task = None
+        if self._port_scan_repopulate:
+            self._port_scan_repopulate = False
+            self.update_com_ports(ports)
+        else:
+            self._available_ports = {location for desc, name, location in ports}
         # Check if port is still ok
-        port_available = False
-        for desc, name, sys in gen_serial_ports():
-            try:
-                if (sys == self.currentPort()):
-                    port_available = True
-            except:
-                pass
+        port_available = self.currentPort() in self._available_ports
 
         if (port_available == False):
             current_system_status.comm_status = "Error: Port No Longer Available!"
@@ -566,19 +905,10 @@ class Ui(QtWidgets.QMainWindow):
                 self.ser.close()
             except:
                 pass
-        # Do GUI Updates
-        self.findChild(QtWidgets.QLabel, 'data_GNSS').setText(
-            current_geolocation.print_nice())
-        self.findChild(QtWidgets.QLabel, 'data_Status').setText(
-            current_system_status.print_nice())
-        if (self.tracker_active):
-            self.findChild(QtWidgets.QPushButton, 'Button_GPS_Tracker').setText(
-                'GPS Tracker ' + str(round(self.timerTracker.remainingTime() / 1000 / 60, 1)) + " min")
-        else:
-            self.findChild(QtWidgets.QPushButton,
-                           'Button_GPS_Tracker').setText('GPS Tracker')
 
-    def timer5s_exec(self):
+    def timer_mail_exec(self):
+        if not self._ser_open:  # Nothing to poll until a port is opened
+            return
         # Check for Mail
         self.send_Serial_Command("MM L=U", False)  # request list of unread
         self.send_Serial_Command("MT C=U", False)  # request count of unsent
@@ -587,55 +917,51 @@ class Ui(QtWidgets.QMainWindow):
         self.sendTDSwarmStr(APPID_OUTGOING_GPS_PING,
                          current_geolocation.return_location())
 
-    def update_com_ports(self) -> None:
-        self.findChild(QtWidgets.QComboBox, 'comboBox_PORT').clear()
-        for desc, name, sys in gen_serial_ports():
+    def update_com_ports(self, ports=None) -> None:
+        if ports is None:
+            ports = gen_serial_ports()
+        self._port_combo.clear()
+        self._available_ports = set()
+        for desc, name, location in ports:
             longname = desc + " (" + name + ")"
-            self.findChild(QtWidgets.QComboBox,
-                           'comboBox_PORT').addItem(longname, sys)
+            self._port_combo.addItem(longname, location)
+            self._available_ports.add(location)
 
     def currentPort(self) -> str:
-        return self.findChild(QtWidgets.QComboBox, 'comboBox_PORT').currentData()
+        return self._port_combo.currentData()
 
     def loadHistory(self):
         # load Settings file
-        self.settings = QSettings(APPNAME, ORGNAME)
-
         port_name = self.settings.value(SETTING_PORT_NAME)
         if port_name is not None:
-            index = self.findChild(QtWidgets.QComboBox,
-                                   'comboBox_PORT').findData(port_name)
+            index = self._port_combo.findData(port_name)
             if index > -1:
-                self.findChild(QtWidgets.QComboBox,
-                               'comboBox_PORT').setCurrentIndex(index)
+                self._port_combo.setCurrentIndex(index)
 
         # look for the appropriate directory
-        if not os.path.exists(GRIBFOLDER):
-            os.makedirs(GRIBFOLDER)
+        os.makedirs(GRIBFOLDER, exist_ok=True)
         try:
-            if os.path.exists(MSGLOG):
-                # load log into terminal
-                f = open(MSGLOG, "r")
-                for line in f:
-                    self.findChild(QtWidgets.QPlainTextEdit, 'Messages_Display').appendPlainText(
-                        line.strip())
-            else:
-                # make new log file
-                f = open(MSGLOG, "w")
-            f.close()
-        except:
+            # load log into terminal, __init__ has already created the file
+            with open(MSGLOG, "r", buffering=65536) as f:
+                history = f.read()
+            # Insert the whole history at once, one layout pass instead of one per line
+            self._messages_display.setUpdatesEnabled(False)
+            self._messages_display.setPlainText(history.rstrip('\n'))
+            self._messages_display.setUpdatesEnabled(True)
+        except (OSError, ValueError):  # Missing or undecodable history
             logging.error("Unable to open" + MSGLOG)
 
     def save_settings(self) -> None:
         logging.info("Saving Settings")
-        self.settings = QSettings(APPNAME, ORGNAME)
         self.settings.setValue(SETTING_PORT_NAME, self.currentPort())
-        self.settings.sync()
+        self._settings_sync_timer.start()
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle Close event of the Program."""
         try:
             self.save_settings()
+            self._settings_sync_timer.stop()
+            self.settings.sync()  # Don't leave the save waiting on the timer
         except:
             pass
 
@@ -645,233 +971,227 @@ class Ui(QtWidgets.QMainWindow):
             pass
 
         try:
-            self.f.close()
+            self._msglog_fp.close()
         except:
             pass
 
+        log_handler.flush()
+
         event.accept()
 
 
 class QDialogMessage(QtWidgets.QDialog):
     compressed_message = bytearray()
     
-    def __init__(self):
-        super(QDialogMessage, self).__init__()
-        uic.loadUi('message.ui', self)
-        self.findChild(QtWidgets.QLineEdit, 'lineEdit_TO').textChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QLineEdit, 'lineEdit_Subject').textChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QPlainTextEdit, 'plainTextEdit_Message').textChanged.connect(
-            self.calculateMessage)
+    def __init__(self, parent=None):
+        super(QDialogMessage, self).__init__(parent)
+        self._form = load_form(self, 'message.ui')
+        self._to_edit = self.findChild(QtWidgets.QLineEdit, 'lineEdit_TO')
+        self._subject_edit = self.findChild(
+            QtWidgets.QLineEdit, 'lineEdit_Subject')
+        self._message_edit = self.findChild(
+            QtWidgets.QPlainTextEdit, 'plainTextEdit_Message')
+        self._size_label = self.findChild(QtWidgets.QLabel, 'label_Size_Calc')
+
+        # Collapse bursts of edits into a single recalculation
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(RECALC_DELAY_MS)
+        self._recalc_timer.timeout.connect(self._do_calculate)
+
+        self._to_edit.textChanged.connect(self.calculateMessage)
+        self._subject_edit.textChanged.connect(self.calculateMessage)
+        self._message_edit.textChanged.connect(self.calculateMessage)
         self.findChild(QtWidgets.QPushButton,'Button_Send').clicked.connect(self.Button_Send_Push)
-        self.calculateMessage()
+        self._do_calculate()
+
+    def calculateMessage(self, *args):
+        self._recalc_timer.start()
 
-    def calculateMessage(self):
-        field_to = self.findChild(QtWidgets.QLineEdit, 'lineEdit_TO').text()
-        field_subject = self.findChild(QtWidgets.QLineEdit, 'lineEdit_Subject').text()
-        field_message = self.findChild(QtWidgets.QPlainTextEdit, 'plainTextEdit_Message').toPlainText()
-        display_message = "T|"
-        display_message += field_to
-        display_message += "S|"
-        display_message += field_subject
-        display_message += "M|"
-        display_message += field_message
+    def _do_calculate(self):
+        display_message = "".join((
+            "T|", self._to_edit.text(),
+            "S|", self._subject_edit.text(),
+            "M|", self._message_edit.toPlainText()))
         #Compress message with Zlib no headers/checksum
         compressor = zlib.compressobj(zlib.Z_BEST_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
         self.compressed_message = compressor.compress(display_message.encode())
         self.compressed_message += compressor.flush()
         compressedlength = len(self.compressed_message)
-        uncompressed_length = len(display_message)        
-        self.findChild(QtWidgets.QLabel, 'label_Size_Calc').setText(str(compressedlength) +
-                                                                    " bytes" + " (Compression saved: " + str(uncompressed_length - compressedlength) + ")")
+        uncompressed_length = len(display_message)
+        self._size_label.setText(
+            f"{compressedlength} bytes (Compression saved: {uncompressed_length - compressedlength})")
 
     def returnData(self):
         return self.compressed_message
 
     def Button_Send_Push(self):
+        if self._recalc_timer.isActive():  # Pick up any edit still waiting
+            self._recalc_timer.stop()
+            self._do_calculate()
+        packets = -(-len(self.compressed_message) // MESSAGE_CHUNK_SIZE)
+        if packets > MESSAGE_MAX_PACKETS:  # Keep the dialog open to edit it
+            show_error(self, "Message is too long, please shorten it")
+            return
         self.done(1)
 
 
 class QDialogGRIB(QtWidgets.QDialog):
-    def __init__(self):
-        super(QDialogGRIB, self).__init__()
-        uic.loadUi('gribReq.ui', self)
-        self.findChild(QtWidgets.QPushButton, 'Button_Get_Location').clicked.connect(self.Button_Get_Location_Click)
-        self.findChild(QtWidgets.QPushButton, 'Button_Send_GRIB').clicked.connect(
+    def __init__(self, parent=None):
+        super(QDialogGRIB, self).__init__(parent)
+        self._form = load_form(self, 'gribReq.ui')
+        # Every control lives directly in the grid layout container
+        form = self.findChild(QtWidgets.QWidget, 'gridLayoutWidget')
+        direct = Qt.FindDirectChildrenOnly
+        self._model_combo = form.findChild(QtWidgets.QComboBox, 'comboBox_Model', direct)
+        self._res_combo = form.findChild(QtWidgets.QComboBox, 'comboBox_Res', direct)
+        self._range_combo = form.findChild(QtWidgets.QComboBox, 'comboBox_Range', direct)
+        self._interval_combo = form.findChild(
+            QtWidgets.QComboBox, 'comboBox_Interval', direct)
+        self._lat_max_spin = form.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Max', direct)
+        self._lat_min_spin = form.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Min', direct)
+        self._long_max_spin = form.findChild(
+            QtWidgets.QSpinBox, 'spinBox_Long_Max', direct)
+        self._long_min_spin = form.findChild(
+            QtWidgets.QSpinBox, 'spinBox_Long_Min', direct)
+        self._request_edit = form.findChild(
+            QtWidgets.QLineEdit, 'lineEdit_Request', direct)
+        # Data type checkboxes, keyed on their name after 'checkBox_'
+        self._cb = {name: form.findChild(QtWidgets.QCheckBox, 'checkBox_' + name, direct)
+                    for name in ('Current', 'AirT', 'CAPE', 'Cloud',
+                                 'Pressure', 'Wave', 'Wind', 'Wing')}
+        # Every checkbox is reset on a model change, in this fixed order
+        self._entry_reset_cbs = tuple(self._cb.items())
+        # and the request token each one adds
+        self._checkboxes = [
+            (self._cb['Current'], "CUR"),
+            (self._cb['AirT'], "AIRT"),
+            (self._cb['CAPE'], "CAPE"),
+            (self._cb['Cloud'], "CLOUD"),
+            (self._cb['Pressure'], "PRESS"),
+            (self._cb['Wave'], "WAVE"),
+            (self._cb['Wind'], "WIND"),
+            (self._cb['Wing'], "GUST"),
+        ]
+
+        # Collapse bursts of changes into a single recalculation
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(RECALC_DELAY_MS)
+        self._recalc_timer.timeout.connect(self._do_calculate)
+
+        form.findChild(QtWidgets.QPushButton, 'Button_Get_Location', direct).clicked.connect(self.Button_Get_Location_Click)
+        form.findChild(QtWidgets.QPushButton, 'Button_Send_GRIB', direct).clicked.connect(
             self.Button_Send_GRIB_Click)
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Model').currentTextChanged.connect(
-            self.change_model)
-        self.change_model(self.findChild(
-            QtWidgets.QComboBox, 'comboBox_Model').currentText())  # Set Checkboxs to Default
+        # One ready-bound preset applier per model
+        self._appliers = {
+            model: functools.partial(self._apply_model_profile, profile,
+                                     MODEL_RANGES.get(model, ()))
+            for model, profile in MODEL_PROFILES.items()}
+        self._last_model = None  # Model whose preset is currently applied
+        # Same thread on both ends, so skip the queued dispatch check
+        self._model_combo.currentTextChanged.connect(
+            self.change_model, Qt.DirectConnection)
+        self.change_model(
+            self._model_combo.currentText())  # Set Checkboxs to Default
         # Connect Change Listeners
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Model').currentIndexChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Res').currentIndexChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Range').currentIndexChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Interval').currentIndexChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Max').valueChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Min').valueChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Long_Min').valueChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Long_Max').valueChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Current').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_AirT').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_CAPE').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Cloud').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Pressure').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wave').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wind').stateChanged.connect(
-            self.calculateMessage)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wing').stateChanged.connect(
-            self.calculateMessage)
-        self.calculateMessage()
+        for combo in (self._model_combo, self._res_combo,
+                      self._range_combo, self._interval_combo):
+            combo.currentIndexChanged.connect(self.calculateMessage)
+        for spin in (self._lat_max_spin, self._lat_min_spin,
+                     self._long_min_spin, self._long_max_spin):
+            spin.valueChanged.connect(self.calculateMessage)
+        for checkbox, token in self._checkboxes:
+            checkbox.stateChanged.connect(self.calculateMessage)
+        self._do_calculate()
 
     def Button_Send_GRIB_Click(self):
-        if self.calc_size() <= 0.0:
-            msg = QtWidgets.QMessageBox()
-            msg.setWindowTitle("Error")
-            msg.setText("Estimate is negative, please check variables")
-            msg.setIcon(QtWidgets.QMessageBox.Critical)
-            msg.exec_()
+        if self._recalc_timer.isActive():  # Pick up any change still waiting
+            self._recalc_timer.stop()
+            self._do_calculate()
+        if self._lat_max_spin.value() < self._lat_min_spin.value():
+            show_error(self, "Latitude max bound is below the min bound")
+        elif self.calc_size() > SWARM_MAX_PAYLOAD:
+            show_error(self, "Request is longer than " + str(SWARM_MAX_PAYLOAD) +
+                       " bytes, please narrow the data types")
         else:
             self.done(1)
 
-    def calculateMessage(self):
+    def calculateMessage(self, *args):
+        self._recalc_timer.start()
+
+    def calc_size(self):
+        """Return the request's size in bytes as it goes into the TD packet"""
+        return len(self._request_edit.text().encode('utf-8'))
+
+    def _do_calculate(self):
         # Example built around Saildocs send GFS:57N,44N,133W,113W|2.0,2.0|0,6,12..48|= WIND,PRESS
-        # Model
-        return_message = self.findChild(
-            QtWidgets.QComboBox, 'comboBox_Model').currentText() + ":"
-        # GPS Range
-        return_message += str(self.findChild(QtWidgets.QSpinBox,
-                              'spinBox_Lat_Max').value()) + ","
-        return_message += str(self.findChild(QtWidgets.QSpinBox,
-                              'spinBox_Lat_Min').value()) + ","
-        return_message += str(self.findChild(QtWidgets.QSpinBox,
-                              'spinBox_Long_Max').value()) + ","
-        return_message += str(self.findChild(QtWidgets.QSpinBox,
-                              'spinBox_Long_Min').value()) + "|"
-        
-        # Resolution
-        return_message += str(self.findChild(QtWidgets.QComboBox,
-                              'comboBox_Res').currentText()) + "|"
-        #Interval and Duration
-        return_message += self.findChild(QtWidgets.QComboBox,'comboBox_Interval').currentText() + ","
-        return_message += str(int(self.findChild(QtWidgets.QComboBox,'comboBox_Range').currentText()) *24) + "|"
+        # Model, GPS Range, Resolution, then Interval and Duration
+        return_message = (
+            f"{self._model_combo.currentText()}:"
+            f"{self._lat_max_spin.value()},{self._lat_min_spin.value()},"
+            f"{self._long_max_spin.value()},{self._long_min_spin.value()}|"
+            f"{self._res_combo.currentText()}|"
+            f"{self._interval_combo.currentText()},"
+            f"{int(self._range_combo.currentText()) * 24}")
         # Data Types
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Current').checkState():
-            return_message += "CUR,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_AirT').checkState():
-            return_message += "AIRT,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_CAPE').checkState():
-            return_message += "CAPE,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Cloud').checkState():
-            return_message += "CLOUD,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Pressure').checkState():
-            return_message += "PRESS,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Wave').checkState():
-            return_message += "WAVE,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Wind').checkState():
-            return_message += "WIND,"
-        if self.findChild(QtWidgets.QCheckBox, 'checkBox_Wing').checkState():
-            return_message += "GUST,"
-
-        self.findChild(QtWidgets.QLineEdit, 'lineEdit_Request').setText(
-            return_message[:len(return_message)-1])
+        data_types = [token for checkbox, token in self._checkboxes
+                      if checkbox.isChecked()]
+        if data_types:
+            return_message = "|".join((return_message, ",".join(data_types)))
 
+        self._request_edit.setText(return_message)
 
     def returnString(self):
-        return self.findChild(QtWidgets.QLineEdit, 'lineEdit_Request').text()
+        return self._request_edit.text()
 
     def Button_Get_Location_Click(self):
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Max').setValue(
-            round(current_geolocation.latitude))
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Lat_Min').setValue(
-            round(current_geolocation.latitude))
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Long_Max').setValue(
-            round(current_geolocation.longitude))
-        self.findChild(QtWidgets.QSpinBox, 'spinBox_Long_Min').setValue(
-            round(current_geolocation.longitude))
+        self._lat_max_spin.setValue(round(current_geolocation.latitude))
+        self._lat_min_spin.setValue(round(current_geolocation.latitude))
+        self._long_max_spin.setValue(round(current_geolocation.longitude))
+        self._long_min_spin.setValue(round(current_geolocation.longitude))
 
     def change_model(self, new_model):
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Current').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_AirT').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_CAPE').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Cloud').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Pressure').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Wave').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Wind').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Wing').setCheckState(Qt.Unchecked)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Current').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_AirT').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_CAPE').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Cloud').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox,
-                       'checkBox_Pressure').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wave').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wind').setEnabled(True)
-        self.findChild(QtWidgets.QCheckBox, 'checkBox_Wing').setEnabled(True)
-
-        self.findChild(QtWidgets.QComboBox, 'comboBox_Range').clear()
-        if (new_model == 'GFS' ):
-                for x in range(1, 17):
-                    self.findChild(QtWidgets.QComboBox,
-                                   'comboBox_Range').addItem(str(x))
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Current').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Wind').setCheckState(Qt.Checked)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Pressure').setCheckState(Qt.Checked)
-        elif (new_model == 'RTOFS' ):
-                for x in range(1, 7):
-                    self.findChild(QtWidgets.QComboBox,
-                                   'comboBox_Range').addItem(str(x))
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Current').setCheckState(Qt.Checked)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Current').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_AirT').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_CAPE').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Cloud').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Pressure').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Wave').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Wind').setEnabled(False)
-                self.findChild(QtWidgets.QCheckBox,
-                               'checkBox_Wing').setEnabled(False)
-        elif (new_model == 'Local' ):
-            return
-        elif (new_model == 'ECMWG' ):
+        if new_model in _NOOP_MODELS:  # No presets, leave the form as it is
             return
-        elif (new_model == 'SPIRE' ):
+        if new_model == self._last_model:  # Preset is already applied
             return
+        self._appliers.get(new_model, self._noop)()
+        self._last_model = new_model
+
+    def _noop(self):
+        pass
+
+    def _apply_model_profile(self, profile, range_items):
+        """Apply checkbox (enabled, state) pairs and range items in one repaint"""
+        widgets = (*self._cb.values(), self._range_combo)
+        self.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            # Local bindings keep lookups out of the loop
+            default = _PROFILE_DEFAULT
+            get = profile.get
+            for name, checkbox in self._entry_reset_cbs:
+                enabled, state = get(name, default)
+                checkbox.setEnabled(enabled)
+                checkbox.setCheckState(state)
+            range_combo = self._range_combo
+            view = range_combo.view()  # Popup relayouts once, not per item
+            view.setUpdatesEnabled(False)
+            try:
+                range_combo.clear()
+                range_combo.addItems(range_items)
+            finally:
+                view.setUpdatesEnabled(True)
+            view.update()
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.update()
+        # Signals were blocked, so recalculate the request once here
+        self.calculateMessage()
 
 
 app = QtWidgets.QApplication(sys.argv)
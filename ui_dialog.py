@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(574, 729)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        MainWindow.setFont(font)
+        MainWindow.setMouseTracking(False)
+        self.gridLayoutWidget = QtWidgets.QWidget(MainWindow)
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setContentsMargins(12, 12, 12, 12)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_COM_PORT = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_COM_PORT.setObjectName("label_COM_PORT")
+        self.gridLayout.addWidget(self.label_COM_PORT, 1, 0, 1, 1)
+        self.Button_Advanced = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Advanced.setObjectName("Button_Advanced")
+        self.gridLayout.addWidget(self.Button_Advanced, 15, 2, 1, 1, QtCore.Qt.AlignBottom)
+        self.label_GNSS_status = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_GNSS_status.sizePolicy().hasHeightForWidth())
+        self.label_GNSS_status.setSizePolicy(sizePolicy)
+        self.label_GNSS_status.setObjectName("label_GNSS_status")
+        self.gridLayout.addWidget(self.label_GNSS_status, 6, 0, 1, 1, QtCore.Qt.AlignTop)
+        self.Button_Open_Port = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Open_Port.setObjectName("Button_Open_Port")
+        self.gridLayout.addWidget(self.Button_Open_Port, 2, 2, 1, 1)
+        self.comboBox_PORT = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.comboBox_PORT.setObjectName("comboBox_PORT")
+        self.gridLayout.addWidget(self.comboBox_PORT, 1, 1, 1, 1)
+        self.label_Commands = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Commands.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_Commands.setObjectName("label_Commands")
+        self.gridLayout.addWidget(self.label_Commands, 0, 2, 1, 1)
+        self.label_COM_Status = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_COM_Status.setObjectName("label_COM_Status")
+        self.gridLayout.addWidget(self.label_COM_Status, 2, 0, 1, 1)
+        self.Button_Refresh_PORT = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Refresh_PORT.setObjectName("Button_Refresh_PORT")
+        self.gridLayout.addWidget(self.Button_Refresh_PORT, 1, 2, 1, 1)
+        self.Label_Title = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Label_Title.sizePolicy().hasHeightForWidth())
+        self.Label_Title.setSizePolicy(sizePolicy)
+        self.Label_Title.setObjectName("Label_Title")
+        self.gridLayout.addWidget(self.Label_Title, 0, 0, 1, 1)
+        self.data_GNSS = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.data_GNSS.sizePolicy().hasHeightForWidth())
+        self.data_GNSS.setSizePolicy(sizePolicy)
+        self.data_GNSS.setMinimumSize(QtCore.QSize(0, 0))
+        self.data_GNSS.setText("")
+        self.data_GNSS.setTextInteractionFlags(QtCore.Qt.LinksAccessibleByMouse|QtCore.Qt.TextSelectableByKeyboard|QtCore.Qt.TextSelectableByMouse)
+        self.data_GNSS.setObjectName("data_GNSS")
+        self.gridLayout.addWidget(self.data_GNSS, 6, 1, 1, 1)
+        self.Messages_Display = QtWidgets.QPlainTextEdit(self.gridLayoutWidget)
+        self.Messages_Display.setMinimumSize(QtCore.QSize(0, 200))
+        self.Messages_Display.setObjectName("Messages_Display")
+        self.gridLayout.addWidget(self.Messages_Display, 9, 0, 7, 2)
+        self.advancedSection = QtWidgets.QWidget(self.gridLayoutWidget)
+        self.advancedSection.setObjectName("advancedSection")
+        self.advancedSection_layout = QtWidgets.QGridLayout(self.advancedSection)
+        self.advancedSection_layout.setContentsMargins(0, 0, 0, 0)
+        self.advancedSection_layout.setSpacing(6)
+        self.advancedSection_layout.setObjectName("advancedSection_layout")
+        self.Button_Serial_Monitor_Send = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Serial_Monitor_Send.setObjectName("Button_Serial_Monitor_Send")
+        self.advancedSection_layout.addWidget(self.Button_Serial_Monitor_Send, 6, 1, 1, 1)
+        self.Serial_Monitor_Display = QtWidgets.QPlainTextEdit(self.advancedSection)
+        self.Serial_Monitor_Display.setObjectName("Serial_Monitor_Display")
+        self.advancedSection_layout.addWidget(self.Serial_Monitor_Display, 4, 0, 2, 1)
+        self.Serial_Monitor_SendLine = QtWidgets.QLineEdit(self.advancedSection)
+        self.Serial_Monitor_SendLine.setObjectName("Serial_Monitor_SendLine")
+        self.advancedSection_layout.addWidget(self.Serial_Monitor_SendLine, 6, 0, 1, 1)
+        self.Label_Serial_Monitor = QtWidgets.QLabel(self.advancedSection)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Label_Serial_Monitor.sizePolicy().hasHeightForWidth())
+        self.Label_Serial_Monitor.setSizePolicy(sizePolicy)
+        self.Label_Serial_Monitor.setObjectName("Label_Serial_Monitor")
+        self.advancedSection_layout.addWidget(self.Label_Serial_Monitor, 3, 0, 1, 1)
+        self.line_3 = QtWidgets.QFrame(self.advancedSection)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.advancedSection_layout.addWidget(self.line_3, 2, 0, 1, 2)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.Button_DeviceID = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_DeviceID.setObjectName("Button_DeviceID")
+        self.verticalLayout.addWidget(self.Button_DeviceID)
+        self.Button_Firmware = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Firmware.setObjectName("Button_Firmware")
+        self.verticalLayout.addWidget(self.Button_Firmware)
+        self.Button_Geospatial = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Geospatial.setObjectName("Button_Geospatial")
+        self.verticalLayout.addWidget(self.Button_Geospatial)
+        self.Button_Restart = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Restart.setObjectName("Button_Restart")
+        self.verticalLayout.addWidget(self.Button_Restart)
+        self.Button_Empty_TX = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Empty_TX.setObjectName("Button_Empty_TX")
+        self.verticalLayout.addWidget(self.Button_Empty_TX)
+        self.Button_Serial_Terminal_Clear = QtWidgets.QPushButton(self.advancedSection)
+        self.Button_Serial_Terminal_Clear.setObjectName("Button_Serial_Terminal_Clear")
+        self.verticalLayout.addWidget(self.Button_Serial_Terminal_Clear)
+        self.advancedSection_layout.addLayout(self.verticalLayout, 4, 1, 2, 1)
+        self.gridLayout.addWidget(self.advancedSection, 20, 0, 1, 3)
+        self.line = QtWidgets.QFrame(self.gridLayoutWidget)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.gridLayout.addWidget(self.line, 7, 0, 1, 3)
+        self.label_Messages = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Messages.sizePolicy().hasHeightForWidth())
+        self.label_Messages.setSizePolicy(sizePolicy)
+        self.label_Messages.setObjectName("label_Messages")
+        self.gridLayout.addWidget(self.label_Messages, 8, 0, 1, 1)
+        self.label_Portal_HTTP = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Portal_HTTP.setOpenExternalLinks(True)
+        self.label_Portal_HTTP.setObjectName("label_Portal_HTTP")
+        self.gridLayout.addWidget(self.label_Portal_HTTP, 6, 2, 1, 1, QtCore.Qt.AlignHCenter)
+        self.data_Status = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.data_Status.setTextInteractionFlags(QtCore.Qt.LinksAccessibleByMouse|QtCore.Qt.TextSelectableByKeyboard|QtCore.Qt.TextSelectableByMouse)
+        self.data_Status.setObjectName("data_Status")
+        self.gridLayout.addWidget(self.data_Status, 2, 1, 2, 1, QtCore.Qt.AlignTop)
+        self.Button_Close_Port = QtWidgets.QPushButton(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Button_Close_Port.sizePolicy().hasHeightForWidth())
+        self.Button_Close_Port.setSizePolicy(sizePolicy)
+        self.Button_Close_Port.setObjectName("Button_Close_Port")
+        self.gridLayout.addWidget(self.Button_Close_Port, 3, 2, 1, 1)
+        self.Button_Send_Message = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Send_Message.setObjectName("Button_Send_Message")
+        self.gridLayout.addWidget(self.Button_Send_Message, 9, 2, 1, 1)
+        self.Button_Get_GRIB = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Get_GRIB.setObjectName("Button_Get_GRIB")
+        self.gridLayout.addWidget(self.Button_Get_GRIB, 10, 2, 1, 1)
+        self.Button_Mailbox = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Mailbox.setObjectName("Button_Mailbox")
+        self.gridLayout.addWidget(self.Button_Mailbox, 11, 2, 1, 1)
+        self.Button_GPS_Tracker = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_GPS_Tracker.setStyleSheet("")
+        self.Button_GPS_Tracker.setCheckable(True)
+        self.Button_GPS_Tracker.setObjectName("Button_GPS_Tracker")
+        self.gridLayout.addWidget(self.Button_GPS_Tracker, 12, 2, 1, 1)
+        self.Button_Send_Ping = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Send_Ping.setObjectName("Button_Send_Ping")
+        self.gridLayout.addWidget(self.Button_Send_Ping, 13, 2, 1, 1)
+        MainWindow.setCentralWidget(self.gridLayoutWidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Swarm Sailor"))
+        self.label_COM_PORT.setText(_translate("MainWindow", "COM Port:"))
+        self.Button_Advanced.setToolTip(_translate("MainWindow", "Close or Open Advanced Window"))
+        self.Button_Advanced.setText(_translate("MainWindow", "Advanced"))
+        self.label_GNSS_status.setText(_translate("MainWindow", "GNSS:"))
+        self.Button_Open_Port.setText(_translate("MainWindow", "Open Port"))
+        self.label_Commands.setText(_translate("MainWindow", "Commands"))
+        self.label_COM_Status.setText(_translate("MainWindow", "Status:"))
+        self.Button_Refresh_PORT.setText(_translate("MainWindow", "Refresh"))
+        self.Label_Title.setText(_translate("MainWindow", "SWARM SAILOR GUI"))
+        self.Button_Serial_Monitor_Send.setToolTip(_translate("MainWindow", "Send to Serial"))
+        self.Button_Serial_Monitor_Send.setText(_translate("MainWindow", "Send"))
+        self.Label_Serial_Monitor.setText(_translate("MainWindow", "Serial Monitor"))
+        self.line_3.setToolTip(_translate("MainWindow", "Don\'t Spook the Meatloaf"))
+        self.Button_DeviceID.setToolTip(_translate("MainWindow", "Get Device ID"))
+        self.Button_DeviceID.setText(_translate("MainWindow", "DeviceID"))
+        self.Button_Firmware.setToolTip(_translate("MainWindow", "Get Firmware"))
+        self.Button_Firmware.setText(_translate("MainWindow", "Check Firmware"))
+        self.Button_Geospatial.setToolTip(_translate("MainWindow", "Toggle GNSS data"))
+        self.Button_Geospatial.setText(_translate("MainWindow", "Geospatial"))
+        self.Button_Restart.setToolTip(_translate("MainWindow", "Restart Modem"))
+        self.Button_Restart.setText(_translate("MainWindow", "Restart"))
+        self.Button_Empty_TX.setText(_translate("MainWindow", "Empty TX"))
+        self.Button_Serial_Terminal_Clear.setText(_translate("MainWindow", "Terminal Clear"))
+        self.label_Messages.setText(_translate("MainWindow", "Messages"))
+        self.label_Portal_HTTP.setText(_translate("MainWindow", "<a href=\"http://portal.swarmsailor.space/\">Web Portal</a>"))
+        self.data_Status.setText(_translate("MainWindow", "Disconnected"))
+        self.Button_Close_Port.setText(_translate("MainWindow", "Close Port"))
+        self.Button_Send_Message.setText(_translate("MainWindow", "Send Message"))
+        self.Button_Get_GRIB.setToolTip(_translate("MainWindow", "Request a new GRIB file"))
+        self.Button_Get_GRIB.setText(_translate("MainWindow", "Request GRIB"))
+        self.Button_Mailbox.setText(_translate("MainWindow", "Check Mailbox"))
+        self.Button_GPS_Tracker.setText(_translate("MainWindow", "GPS Tracker"))
+        self.Button_Send_Ping.setText(_translate("MainWindow", "Send Ping"))
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gribReq.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_QDialog_GRIB(object):
+    def setupUi(self, QDialog_GRIB):
+        QDialog_GRIB.setObjectName("QDialog_GRIB")
+        QDialog_GRIB.resize(695, 346)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        QDialog_GRIB.setFont(font)
+        self.centralwidget = QtWidgets.QWidget(QDialog_GRIB)
+        self.centralwidget.setGeometry(QtCore.QRect(0, 0, 691, 331))
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayoutWidget = QtWidgets.QWidget(self.centralwidget)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(10, 10, 671, 320))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_req = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_req.setObjectName("label_req")
+        self.gridLayout.addWidget(self.label_req, 0, 0, 1, 1)
+        self.spinBox_Long_Max = QtWidgets.QSpinBox(self.gridLayoutWidget)
+        self.spinBox_Long_Max.setMinimum(-180)
+        self.spinBox_Long_Max.setMaximum(180)
+        self.spinBox_Long_Max.setObjectName("spinBox_Long_Max")
+        self.gridLayout.addWidget(self.spinBox_Long_Max, 5, 2, 1, 1)
+        self.spinBox_Long_Min = QtWidgets.QSpinBox(self.gridLayoutWidget)
+        self.spinBox_Long_Min.setMinimum(-180)
+        self.spinBox_Long_Min.setMaximum(180)
+        self.spinBox_Long_Min.setObjectName("spinBox_Long_Min")
+        self.gridLayout.addWidget(self.spinBox_Long_Min, 6, 2, 1, 1)
+        self.label_minBound = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_minBound.setObjectName("label_minBound")
+        self.gridLayout.addWidget(self.label_minBound, 6, 0, 1, 1)
+        self.label_Long = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Long.sizePolicy().hasHeightForWidth())
+        self.label_Long.setSizePolicy(sizePolicy)
+        self.label_Long.setObjectName("label_Long")
+        self.gridLayout.addWidget(self.label_Long, 4, 2, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignBottom)
+        self.label_Max = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Max.setObjectName("label_Max")
+        self.gridLayout.addWidget(self.label_Max, 5, 0, 1, 1)
+        self.comboBox_Range = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.comboBox_Range.setObjectName("comboBox_Range")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.comboBox_Range.addItem("")
+        self.gridLayout.addWidget(self.comboBox_Range, 1, 3, 1, 1)
+        self.label_Lat = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Lat.sizePolicy().hasHeightForWidth())
+        self.label_Lat.setSizePolicy(sizePolicy)
+        self.label_Lat.setObjectName("label_Lat")
+        self.gridLayout.addWidget(self.label_Lat, 4, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignBottom)
+        self.comboBox_Res = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.comboBox_Res.setObjectName("comboBox_Res")
+        self.comboBox_Res.addItem("")
+        self.comboBox_Res.addItem("")
+        self.gridLayout.addWidget(self.comboBox_Res, 2, 1, 1, 1)
+        self.comboBox_Model = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.comboBox_Model.setObjectName("comboBox_Model")
+        self.comboBox_Model.addItem("")
+        self.comboBox_Model.addItem("")
+        self.comboBox_Model.addItem("")
+        self.comboBox_Model.addItem("")
+        self.comboBox_Model.addItem("")
+        self.gridLayout.addWidget(self.comboBox_Model, 1, 1, 1, 1)
+        self.checkBox_Cloud = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Cloud.setObjectName("checkBox_Cloud")
+        self.gridLayout.addWidget(self.checkBox_Cloud, 9, 3, 1, 1)
+        self.Button_Send_GRIB = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Send_GRIB.setObjectName("Button_Send_GRIB")
+        self.gridLayout.addWidget(self.Button_Send_GRIB, 12, 3, 1, 1)
+        self.spinBox_Lat_Min = QtWidgets.QSpinBox(self.gridLayoutWidget)
+        self.spinBox_Lat_Min.setMinimum(-90)
+        self.spinBox_Lat_Min.setMaximum(90)
+        self.spinBox_Lat_Min.setObjectName("spinBox_Lat_Min")
+        self.gridLayout.addWidget(self.spinBox_Lat_Min, 6, 1, 1, 1)
+        self.label_Model = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Model.setObjectName("label_Model")
+        self.gridLayout.addWidget(self.label_Model, 1, 0, 1, 1)
+        self.label_Time = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Time.setObjectName("label_Time")
+        self.gridLayout.addWidget(self.label_Time, 2, 2, 1, 1)
+        self.checkBox_Wave = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Wave.setObjectName("checkBox_Wave")
+        self.gridLayout.addWidget(self.checkBox_Wave, 8, 1, 1, 1)
+        self.checkBox_Pressure = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Pressure.setObjectName("checkBox_Pressure")
+        self.gridLayout.addWidget(self.checkBox_Pressure, 9, 0, 1, 1)
+        self.label_area = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_area.sizePolicy().hasHeightForWidth())
+        self.label_area.setSizePolicy(sizePolicy)
+        self.label_area.setMinimumSize(QtCore.QSize(0, 13))
+        self.label_area.setObjectName("label_area")
+        self.gridLayout.addWidget(self.label_area, 4, 0, 1, 1, QtCore.Qt.AlignBottom)
+        self.line_2 = QtWidgets.QFrame(self.gridLayoutWidget)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.gridLayout.addWidget(self.line_2, 10, 0, 1, 4)
+        self.line = QtWidgets.QFrame(self.gridLayoutWidget)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.gridLayout.addWidget(self.line, 7, 0, 1, 4)
+        self.label_Res = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Res.setObjectName("label_Res")
+        self.gridLayout.addWidget(self.label_Res, 2, 0, 1, 1)
+        self.label_interval = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_interval.setObjectName("label_interval")
+        self.gridLayout.addWidget(self.label_interval, 1, 2, 1, 1)
+        self.line_3 = QtWidgets.QFrame(self.gridLayoutWidget)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.gridLayout.addWidget(self.line_3, 3, 0, 1, 4)
+        self.checkBox_AirT = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_AirT.setObjectName("checkBox_AirT")
+        self.gridLayout.addWidget(self.checkBox_AirT, 8, 2, 1, 1)
+        self.Button_Get_Location = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Get_Location.setObjectName("Button_Get_Location")
+        self.gridLayout.addWidget(self.Button_Get_Location, 6, 3, 1, 1)
+        self.comboBox_Interval = QtWidgets.QComboBox(self.gridLayoutWidget)
+        self.comboBox_Interval.setObjectName("comboBox_Interval")
+        self.comboBox_Interval.addItem("")
+        self.comboBox_Interval.addItem("")
+        self.comboBox_Interval.addItem("")
+        self.comboBox_Interval.addItem("")
+        self.gridLayout.addWidget(self.comboBox_Interval, 2, 3, 1, 1)
+        self.checkBox_CAPE = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_CAPE.setObjectName("checkBox_CAPE")
+        self.gridLayout.addWidget(self.checkBox_CAPE, 9, 1, 1, 1)
+        self.checkBox_Wind = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Wind.setObjectName("checkBox_Wind")
+        self.gridLayout.addWidget(self.checkBox_Wind, 8, 0, 1, 1)
+        self.checkBox_Wing = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Wing.setObjectName("checkBox_Wing")
+        self.gridLayout.addWidget(self.checkBox_Wing, 9, 2, 1, 1)
+        self.spinBox_Lat_Max = QtWidgets.QSpinBox(self.gridLayoutWidget)
+        self.spinBox_Lat_Max.setMinimum(-90)
+        self.spinBox_Lat_Max.setMaximum(90)
+        self.spinBox_Lat_Max.setObjectName("spinBox_Lat_Max")
+        self.gridLayout.addWidget(self.spinBox_Lat_Max, 5, 1, 1, 1)
+        self.checkBox_Current = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.checkBox_Current.setObjectName("checkBox_Current")
+        self.gridLayout.addWidget(self.checkBox_Current, 8, 3, 1, 1)
+        self.lineEdit_Request = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.lineEdit_Request.setObjectName("lineEdit_Request")
+        self.gridLayout.addWidget(self.lineEdit_Request, 11, 0, 1, 4)
+        self.statusbar = QtWidgets.QStatusBar(QDialog_GRIB)
+        self.statusbar.setGeometry(QtCore.QRect(0, 0, 3, 18))
+        self.statusbar.setObjectName("statusbar")
+
+        self.retranslateUi(QDialog_GRIB)
+        self.comboBox_Res.setCurrentIndex(1)
+        QtCore.QMetaObject.connectSlotsByName(QDialog_GRIB)
+
+    def retranslateUi(self, QDialog_GRIB):
+        _translate = QtCore.QCoreApplication.translate
+        QDialog_GRIB.setWindowTitle(_translate("QDialog_GRIB", "GRIB Request"))
+        self.label_req.setText(_translate("QDialog_GRIB", "GRIB Request"))
+        self.label_minBound.setText(_translate("QDialog_GRIB", "Min Bound"))
+        self.label_Long.setText(_translate("QDialog_GRIB", "Longitude E/W"))
+        self.label_Max.setText(_translate("QDialog_GRIB", "Max Bound"))
+        self.comboBox_Range.setItemText(0, _translate("QDialog_GRIB", "1"))
+        self.comboBox_Range.setItemText(1, _translate("QDialog_GRIB", "2"))
+        self.comboBox_Range.setItemText(2, _translate("QDialog_GRIB", "3"))
+        self.comboBox_Range.setItemText(3, _translate("QDialog_GRIB", "4"))
+        self.comboBox_Range.setItemText(4, _translate("QDialog_GRIB", "5"))
+        self.comboBox_Range.setItemText(5, _translate("QDialog_GRIB", "6"))
+        self.comboBox_Range.setItemText(6, _translate("QDialog_GRIB", "7"))
+        self.comboBox_Range.setItemText(7, _translate("QDialog_GRIB", "8"))
+        self.comboBox_Range.setItemText(8, _translate("QDialog_GRIB", "9"))
+        self.comboBox_Range.setItemText(9, _translate("QDialog_GRIB", "10"))
+        self.comboBox_Range.setItemText(10, _translate("QDialog_GRIB", "11"))
+        self.comboBox_Range.setItemText(11, _translate("QDialog_GRIB", "12"))
+        self.comboBox_Range.setItemText(12, _translate("QDialog_GRIB", "13"))
+        self.comboBox_Range.setItemText(13, _translate("QDialog_GRIB", "14"))
+        self.comboBox_Range.setItemText(14, _translate("QDialog_GRIB", "15"))
+        self.comboBox_Range.setItemText(15, _translate("QDialog_GRIB", "16"))
+        self.label_Lat.setText(_translate("QDialog_GRIB", "Latitude N/S"))
+        self.comboBox_Res.setItemText(0, _translate("QDialog_GRIB", "0.5"))
+        self.comboBox_Res.setItemText(1, _translate("QDialog_GRIB", "1.0"))
+        self.comboBox_Model.setItemText(0, _translate("QDialog_GRIB", "GFS"))
+        self.comboBox_Model.setItemText(1, _translate("QDialog_GRIB", "RTOFS"))
+        self.comboBox_Model.setItemText(2, _translate("QDialog_GRIB", "Local"))
+        self.comboBox_Model.setItemText(3, _translate("QDialog_GRIB", "ECMWF (Coming Soon)"))
+        self.comboBox_Model.setItemText(4, _translate("QDialog_GRIB", "SPIRE (Coming Soon)"))
+        self.checkBox_Cloud.setText(_translate("QDialog_GRIB", "Cloud Cover"))
+        self.Button_Send_GRIB.setText(_translate("QDialog_GRIB", "Send Request"))
+        self.label_Model.setText(_translate("QDialog_GRIB", "Model"))
+        self.label_Time.setText(_translate("QDialog_GRIB", "Interval (hours)"))
+        self.checkBox_Wave.setText(_translate("QDialog_GRIB", "Waves"))
+        self.checkBox_Pressure.setText(_translate("QDialog_GRIB", "Pressure"))
+        self.label_area.setText(_translate("QDialog_GRIB", "Area Selection"))
+        self.label_Res.setText(_translate("QDialog_GRIB", "Resolution (degrees)"))
+        self.label_interval.setText(_translate("QDialog_GRIB", "Time Range (Days)"))
+        self.checkBox_AirT.setText(_translate("QDialog_GRIB", "Air Temp"))
+        self.Button_Get_Location.setText(_translate("QDialog_GRIB", "Fill Current Location"))
+        self.comboBox_Interval.setItemText(0, _translate("QDialog_GRIB", "3"))
+        self.comboBox_Interval.setItemText(1, _translate("QDialog_GRIB", "6"))
+        self.comboBox_Interval.setItemText(2, _translate("QDialog_GRIB", "12"))
+        self.comboBox_Interval.setItemText(3, _translate("QDialog_GRIB", "24"))
+        self.checkBox_CAPE.setText(_translate("QDialog_GRIB", "CAPE"))
+        self.checkBox_Wind.setText(_translate("QDialog_GRIB", "Wind"))
+        self.checkBox_Wing.setText(_translate("QDialog_GRIB", "Wind Gust"))
+        self.checkBox_Current.setText(_translate("QDialog_GRIB", "Current"))
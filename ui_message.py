@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'message.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_QDialog_message(object):
+    def setupUi(self, QDialog_message):
+        QDialog_message.setObjectName("QDialog_message")
+        QDialog_message.resize(501, 369)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        QDialog_message.setFont(font)
+        self.centralwidget = QtWidgets.QWidget(QDialog_message)
+        self.centralwidget.setGeometry(QtCore.QRect(10, 0, 481, 361))
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayoutWidget = QtWidgets.QWidget(self.centralwidget)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(10, 10, 461, 341))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout.setObjectName("gridLayout")
+        self.lineEdit_TO = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.lineEdit_TO.setObjectName("lineEdit_TO")
+        self.gridLayout.addWidget(self.lineEdit_TO, 1, 2, 1, 2)
+        self.lineEdit_Subject = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.lineEdit_Subject.setText("")
+        self.lineEdit_Subject.setObjectName("lineEdit_Subject")
+        self.gridLayout.addWidget(self.lineEdit_Subject, 2, 2, 1, 2)
+        self.label_TO = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_TO.setObjectName("label_TO")
+        self.gridLayout.addWidget(self.label_TO, 1, 1, 1, 1)
+        self.label_Subject = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Subject.setObjectName("label_Subject")
+        self.gridLayout.addWidget(self.label_Subject, 2, 1, 1, 1)
+        self.plainTextEdit_Message = QtWidgets.QPlainTextEdit(self.gridLayoutWidget)
+        self.plainTextEdit_Message.setPlainText("")
+        self.plainTextEdit_Message.setObjectName("plainTextEdit_Message")
+        self.gridLayout.addWidget(self.plainTextEdit_Message, 3, 2, 1, 1)
+        self.Button_Send = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.Button_Send.setObjectName("Button_Send")
+        self.gridLayout.addWidget(self.Button_Send, 0, 1, 1, 1)
+        self.label_Size_Calc = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Size_Calc.setObjectName("label_Size_Calc")
+        self.gridLayout.addWidget(self.label_Size_Calc, 5, 2, 1, 1)
+        self.label_Size = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.label_Size.setObjectName("label_Size")
+        self.gridLayout.addWidget(self.label_Size, 5, 1, 1, 1)
+        self.statusbar = QtWidgets.QStatusBar(QDialog_message)
+        self.statusbar.setGeometry(QtCore.QRect(10, 0, 3, 18))
+        self.statusbar.setObjectName("statusbar")
+
+        self.retranslateUi(QDialog_message)
+        QtCore.QMetaObject.connectSlotsByName(QDialog_message)
+
+    def retranslateUi(self, QDialog_message):
+        _translate = QtCore.QCoreApplication.translate
+        QDialog_message.setWindowTitle(_translate("QDialog_message", "Send Message"))
+        self.lineEdit_TO.setText(_translate("QDialog_message", "Email or SMS"))
+        self.label_TO.setText(_translate("QDialog_message", "TO:"))
+        self.label_Subject.setText(_translate("QDialog_message", "Subject:"))
+        self.Button_Send.setText(_translate("QDialog_message", "SEND"))
+        self.label_Size_Calc.setText(_translate("QDialog_message", "1.21 JigaWatts"))
+        self.label_Size.setText(_translate("QDialog_message", "Size"))